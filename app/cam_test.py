@@ -1,9 +1,20 @@
-import cv2
-
-for i in range(5):
-    cap = cv2.VideoCapture(i)
-    if cap.isOpened():
-        print(f"Camera {i} : AVAILABLE")
-        cap.release()
-    else:
-        print(f"Camera {i} : NOT available")
+from capture import CAPTURE_CONFIG, CameraStream, discover_cameras
+
+cameras = discover_cameras()
+
+if not cameras:
+    print("사용 가능한 카메라가 없습니다.")
+
+for cam in cameras:
+    print(f"Camera {cam['source']} : AVAILABLE "
+          f"(default {cam['width']}x{cam['height']} @ {cam['fps']:.1f}fps, {cam['codec']})")
+
+    # 설정값으로 협상했을 때 실제로 적용되는 값 확인
+    stream = CameraStream(cam["source"])
+    if stream.open():
+        info = stream.info
+        print(f"  requested {CAPTURE_CONFIG['width']}x{CAPTURE_CONFIG['height']} "
+              f"@ {CAPTURE_CONFIG['fps']}fps, {CAPTURE_CONFIG['codec']}")
+        print(f"  negotiated {info['width']}x{info['height']} @ {info['fps']:.1f}fps, "
+              f"{info['codec']}, buffer={info['buffer_size']}")
+    stream.release()
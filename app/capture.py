@@ -0,0 +1,181 @@
+import time
+import cv2
+
+# -----------------------------
+# 설정값
+# -----------------------------
+# ROI 좌표(seats_roi.json)는 이 해상도 기준으로 찍혀야 합니다.
+CAPTURE_CONFIG = {
+    "width": 640,
+    "height": 480,
+    "fps": 15,
+    "codec": "MJPG",            # "MJPG" → USB 대역폭/CPU 절약, None → 드라이버 기본(raw YUYV 등)
+    "buffer_size": 1,           # 드라이버 내부 버퍼 (작을수록 지연 ↓)
+    "max_drain_frames": 3,      # 버퍼 크기를 알 수 없을 때 read_latest()가 grab 할 최대 횟수
+    "max_probe_index": 10,      # 장치 탐색 시 확인할 최대 인덱스
+    "reconnect_base_delay": 0.5,
+    "reconnect_max_delay": 10.0,
+    "reconnect_max_retries": 5,  # None → 무한 재시도
+}
+
+
+def _fourcc_to_str(value):
+    code = int(value)
+    if code <= 0:
+        return None
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+
+
+# -----------------------------
+# 장치 / 스트림 탐색
+# -----------------------------
+def discover_cameras(max_index=None, backend=cv2.CAP_ANY):
+    if max_index is None:
+        max_index = CAPTURE_CONFIG["max_probe_index"]
+
+    found = []
+    for i in range(max_index):
+        cap = cv2.VideoCapture(i, backend)
+        if cap.isOpened():
+            info = get_capture_info(cap)
+            info["source"] = i
+            found.append(info)
+        cap.release()
+
+    return found
+
+
+def get_capture_info(cap):
+    return {
+        "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "fps": cap.get(cv2.CAP_PROP_FPS),
+        "codec": _fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC)),
+        "buffer_size": int(cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+    }
+
+
+# -----------------------------
+# 해상도 / FPS / 코덱 협상
+# -----------------------------
+def open_capture(source=0, width=None, height=None, fps=None, codec=None,
+                 buffer_size=None, backend=cv2.CAP_ANY):
+    cap = cv2.VideoCapture(source, backend)
+    if not cap.isOpened():
+        cap.release()
+        return None
+
+    # 코덱은 해상도보다 먼저 지정해야 V4L2에서 MJPEG 해상도 목록이 적용됨
+    # (파일/RTSP 스트림은 코덱이 정해져 있으므로 장치 인덱스일 때만)
+    if codec and isinstance(source, int):
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*codec))
+    if width:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    if height:
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    if fps:
+        cap.set(cv2.CAP_PROP_FPS, fps)
+    if buffer_size is not None:
+        # 지원하지 않는 백엔드는 무시됨 → read_latest()에서 grab으로 비움
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+
+    return cap
+
+
+# -----------------------------
+# 카메라 스트림 (grab / retrieve 분리 + 자동 재연결)
+# -----------------------------
+class CameraStream:
+    def __init__(self, source=0, config=None, backend=cv2.CAP_ANY):
+        self.source = source
+        self.config = {**CAPTURE_CONFIG, **(config or {})}
+        self.backend = backend
+        self.cap = None
+        self.info = None
+
+    # 장치 인덱스 / 네트워크 스트림만 재연결 (파일은 끝나면 그대로 종료)
+    def is_live(self):
+        return isinstance(self.source, int) or "://" in str(self.source)
+
+    def open(self):
+        c = self.config
+        self.cap = open_capture(
+            self.source,
+            width=c["width"],
+            height=c["height"],
+            fps=c["fps"],
+            codec=c["codec"],
+            buffer_size=c["buffer_size"],
+            backend=self.backend,
+        )
+        if self.cap is None:
+            self.info = None
+            return False
+
+        # 실제로 협상된 값 (요청값과 다를 수 있음)
+        self.info = get_capture_info(self.cap)
+        return True
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+        self.cap = None
+
+    def reconnect(self):
+        c = self.config
+        attempt = 0
+
+        while c["reconnect_max_retries"] is None or attempt < c["reconnect_max_retries"]:
+            self.release()
+            delay = min(c["reconnect_base_delay"] * (2 ** attempt), c["reconnect_max_delay"])
+            print(f"카메라 재연결 시도 {attempt + 1} ({delay:.1f}초 대기)")
+            time.sleep(delay)
+
+            if self.open():
+                print(f"카메라 재연결 성공: {self.info}")
+                return True
+            attempt += 1
+
+        return False
+
+    # 프레임을 가져오기만 하고 디코딩은 하지 않음 (버려질 프레임용)
+    def grab(self):
+        if self.cap is not None and self.cap.grab():
+            return True
+
+        if not self.is_live() or not self.reconnect():
+            return False
+
+        return self.cap.grab()
+
+    # 마지막으로 grab 한 프레임만 디코딩
+    def retrieve(self):
+        ret, frame = self.cap.retrieve()
+        return frame if ret else None
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        frame = self.retrieve()
+        return frame is not None, frame
+
+    # 쌓여 있던 오래된 프레임은 grab으로 버리고, 최신 프레임 1장만 디코딩
+    # 버퍼에 남은 프레임은 grab이 바로 반환되고, 버퍼가 비면 새 프레임을 기다리느라
+    # 약 한 프레임 간격이 걸림 → 그때 멈추면 방금 찍힌 프레임을 얻음
+    # (BUFFERSIZE가 적용됐으면 최대 buffer_size + 1번, 0/-1이면 max_drain_frames번)
+    def read_latest(self):
+        fps = self.info["fps"] if self.info else 0
+        buffered = self.info["buffer_size"] if self.info else 0
+        max_grabs = buffered + 1 if buffered > 0 else self.config["max_drain_frames"]
+        frame_interval = 1 / fps if fps > 0 else 0
+
+        for _ in range(max(max_grabs, 1)):
+            t0 = time.monotonic()
+            if not self.grab():
+                return False, None
+
+            if not frame_interval or time.monotonic() - t0 >= frame_interval * 0.8:
+                break
+
+        frame = self.retrieve()
+        return frame is not None, frame
@@ -0,0 +1,62 @@
+import numpy as np
+
+# -----------------------------
+# 설정값
+# -----------------------------
+DETECTION_CONFIG = {
+    # 좌석 판별에 쓰는 클래스만 NMS/후처리 대상 (모델에 없는 이름은 무시됨)
+    "keep_classes": ["person", "backpack", "laptop", "book", "clothes"],
+    "conf": 0.25,
+    "max_det": 100,
+    "imgsz": 640,
+}
+
+
+# -----------------------------
+# 클래스 이름 → 모델 클래스 id
+# -----------------------------
+def resolve_class_ids(model_names, keep_classes):
+    # model.names 는 {id: name} (버전에 따라 list)
+    if isinstance(model_names, dict):
+        items = model_names.items()
+    else:
+        items = enumerate(model_names)
+
+    return [i for i, name in items if name in keep_classes]
+
+
+# -----------------------------
+# 추론 + 결과 변환
+# -----------------------------
+def detect(model, frame, class_ids=None, config=None):
+    c = {**DETECTION_CONFIG, **(config or {})}
+    if class_ids is None:
+        class_ids = resolve_class_ids(model.names, c["keep_classes"])
+
+    # numpy 입력은 BGR 그대로 넘김 (ultralytics가 내부에서 RGB 변환)
+    results = model(
+        frame,
+        classes=class_ids,
+        conf=c["conf"],
+        max_det=c["max_det"],
+        imgsz=c["imgsz"],
+        verbose=False,
+    )[0]
+
+    return boxes_to_detections(results)
+
+
+def boxes_to_detections(results):
+    boxes = results.boxes
+    if boxes is None or len(boxes) == 0:
+        return []
+
+    # 박스마다 tensor 인덱싱하지 않고 한 번에 NumPy로 변환
+    xyxy = boxes.xyxy.cpu().numpy().astype(np.int32)
+    cls = boxes.cls.cpu().numpy().astype(np.int32)
+    names = results.names
+
+    return [
+        {"name": names[c], "bbox": bbox}
+        for c, bbox in zip(cls.tolist(), xyxy.tolist())
+    ]
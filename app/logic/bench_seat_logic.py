@@ -0,0 +1,321 @@
+# cd app && python -m logic.bench_seat_logic --seats 10000 --ticks 300
+# 후보 엔진 검증: python -m logic.bench_seat_logic --engine <seat_logic과 같은 함수를 가진 모듈>
+import argparse
+import copy
+import importlib
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from logic import seat_logic as reference
+
+# -----------------------------
+# 설정값
+# -----------------------------
+BENCH_CONFIG = {
+    "tick_seconds": 0.2,          # main.py 루프 주기와 동일
+    "arrival_per_min": 1.0,       # 빈 좌석에 사람이 앉을 확률 (분당)
+    "leave_per_min": 0.1,         # 앉아 있던 사람이 일어날 확률 (분당)
+    "leave_stuff_ratio": 0.6,     # 일어날 때 짐을 두고 가는 비율
+    "return_per_min": 0.5,        # 짐만 있는 좌석에 돌아올 확률 (분당)
+    "pickup_per_min": 0.05,       # 짐만 있는 좌석에서 짐을 치울 확률 (분당)
+    "flicker": 0.005,             # 프레임마다 검출이 빠질 확률
+    "spurious": 0.002,            # 프레임마다 사람이 잘못 검출될 확률
+    "reserve_per_min": 0.5,       # 예약 해제된 좌석이 다시 예약될 확률 (분당)
+}
+
+SIM_START = datetime(2026, 1, 5, 9, 0, 0)
+AWAY, PRESENT, STUFF = 0, 1, 2
+STUFF_ITEMS = ["backpack", "laptop", "book"]
+
+
+# -----------------------------
+# 가상 검출 스트림
+# -----------------------------
+class DetectionStream:
+    def __init__(self, n_seats, seed, config):
+        self.n = n_seats
+        self.rng = np.random.default_rng(seed)
+        self.cfg = config
+        self.status = np.zeros(n_seats, np.int8)
+        self.items = self.rng.integers(0, len(STUFF_ITEMS), n_seats)
+
+    def _rate(self, per_min):
+        # 분당 확률 → tick당 확률
+        return per_min * self.cfg["tick_seconds"] / 60
+
+    def step(self):
+        c, n, rng = self.cfg, self.n, self.rng
+        r = rng.random(n)
+        s = self.status
+        away, present, stuff = s == AWAY, s == PRESENT, s == STUFF
+
+        leave = present & (r < self._rate(c["leave_per_min"]))
+        leave_stuff = leave & (rng.random(n) < c["leave_stuff_ratio"])
+
+        new = s.copy()
+        new[away & (r < self._rate(c["arrival_per_min"]))] = PRESENT
+        new[leave] = AWAY
+        new[leave_stuff] = STUFF
+        new[stuff & (r < self._rate(c["return_per_min"]))] = PRESENT
+        new[stuff & (r > 1 - self._rate(c["pickup_per_min"]))] = AWAY
+        self.status = new
+
+        miss = rng.random(n) < c["flicker"]
+        ghost = rng.random(n) < c["spurious"]
+        reserve = rng.random(n) < self._rate(c["reserve_per_min"])
+
+        detections = []
+        for st, item, m, g in zip(new.tolist(), self.items.tolist(), miss.tolist(), ghost.tolist()):
+            if m:
+                names = []
+            elif st == PRESENT:
+                names = ["person"]
+            elif st == STUFF:
+                names = [STUFF_ITEMS[item]]
+            else:
+                names = []
+            if g:
+                names = names + ["person"]
+            detections.append(names)
+
+        return detections, reserve.tolist()
+
+
+# -----------------------------
+# 1 tick = main.py 루프 1회
+# -----------------------------
+def apply_reservations(seats, seat_ids, reserve, now):
+    # 예약 시스템 흉내: 해제된 좌석이 새로 예약됨
+    for sid, r in zip(seat_ids, reserve):
+        s = seats[sid]
+        if r and not s["reserved"]:
+            s["reserved"] = True
+            s["reserved_at"] = now
+            s["unreserve_deadline"] = now + timedelta(minutes=1)
+            s["ever_occupied"] = False
+
+
+def run_tick(engine, seats, seat_ids, detections, now):
+    results = []
+    for sid, names in zip(seat_ids, detections):
+        seat_info = seats[sid]
+        inferred = engine.check_status(names)
+        result = engine.update_seat_state(seat_info, inferred, now)
+
+        if isinstance(result, tuple):
+            final_state, temp_state, remain = result
+        else:
+            final_state, temp_state, remain = result, None, None
+
+        seat_info["state"] = final_state
+        seat_info["temp_state"] = temp_state
+        seat_info["remain"] = remain
+        results.append(result)
+
+    engine.update_release_timer(seats, now)
+    alerts = engine.update_policies(seats, now)
+    return results, alerts
+
+
+def make_seats(engine, n_seats, seed):
+    random.seed(seed)
+    seat_ids = [f"S{i:05d}" for i in range(n_seats)]
+    return seat_ids, engine.init_seats(seat_ids, now=SIM_START)
+
+
+# -----------------------------
+# 처리량 (tracemalloc 없이)
+# -----------------------------
+def bench_throughput(engine, n_seats, ticks, seed, config):
+    seat_ids, seats = make_seats(engine, n_seats, seed)
+    stream = DetectionStream(n_seats, seed, config)
+    dt = timedelta(seconds=config["tick_seconds"])
+    now = SIM_START
+    engine_time = 0.0
+    n_alerts = 0
+
+    for _ in range(ticks):
+        now += dt
+        detections, reserve = stream.step()
+        apply_reservations(seats, seat_ids, reserve, now)
+
+        t0 = time.perf_counter()
+        _, alerts = run_tick(engine, seats, seat_ids, detections, now)
+        engine_time += time.perf_counter() - t0
+        n_alerts += len(alerts)
+
+    states = {}
+    for s in seats.values():
+        states[s["state"]] = states.get(s["state"], 0) + 1
+
+    return {
+        "ticks_per_sec": ticks / engine_time,
+        "seat_updates_per_sec": n_seats * ticks / engine_time,
+        "ms_per_tick": engine_time / ticks * 1000,
+        "alerts": n_alerts,
+        "final_states": states,
+    }
+
+
+# -----------------------------
+# 메모리 / 할당 (tracemalloc)
+# -----------------------------
+def bench_memory(engine, n_seats, ticks, seed, config):
+    dt = timedelta(seconds=config["tick_seconds"])
+    engine_only = [tracemalloc.Filter(True, engine.__file__)]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    seat_ids, seats = make_seats(engine, n_seats, seed)
+    per_seat = (tracemalloc.get_traced_memory()[0] - before) / n_seats
+
+    stream = DetectionStream(n_seats, seed, config)
+    now = SIM_START
+    peaks = []
+    first = None
+
+    for i in range(ticks):
+        now += dt
+        detections, reserve = stream.step()
+        apply_reservations(seats, seat_ids, reserve, now)
+
+        if i == 1:
+            first = tracemalloc.take_snapshot().filter_traces(engine_only)
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        run_tick(engine, seats, seat_ids, detections, now)
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+
+    last = tracemalloc.take_snapshot().filter_traces(engine_only)
+    tracemalloc.stop()
+
+    # 엔진 코드 라인별 할당 (블록 수 변화)
+    diff = last.compare_to(first, "lineno") if first is not None else []
+    top = [(str(d.traceback), d.count_diff, d.size_diff) for d in diff[:5] if d.count_diff]
+
+    return {
+        "bytes_per_seat": per_seat,
+        "peak_bytes_per_tick": max(peaks) if peaks else 0,
+        "mean_peak_bytes_per_tick": sum(peaks) / len(peaks) if peaks else 0,
+        "retained_blocks": sum(d.count_diff for d in diff),
+        "top_allocations": top,
+    }
+
+
+# -----------------------------
+# 장시간 실행 (메모리 누수 확인)
+# -----------------------------
+def bench_soak(engine, n_seats, ticks, seed, config, samples=10):
+    dt = timedelta(seconds=config["tick_seconds"])
+    every = max(ticks // samples, 1)
+    memory = []
+
+    tracemalloc.start()
+    seat_ids, seats = make_seats(engine, n_seats, seed)
+    stream = DetectionStream(n_seats, seed, config)
+    now = SIM_START
+
+    for i in range(ticks):
+        now += dt
+        detections, reserve = stream.step()
+        apply_reservations(seats, seat_ids, reserve, now)
+        run_tick(engine, seats, seat_ids, detections, now)
+
+        if i % every == 0 or i == ticks - 1:
+            memory.append((i + 1, tracemalloc.get_traced_memory()[0]))
+    tracemalloc.stop()
+
+    return memory
+
+
+# -----------------------------
+# 동작 동일성 (기준 엔진 vs 후보 엔진)
+# -----------------------------
+def check_equivalence(candidate, n_seats, ticks, seed, config):
+    # 두 엔진 모두 기준 엔진이 만든 같은 초기 상태에서 시작
+    seat_ids, ref_seats = make_seats(reference, n_seats, seed)
+    cand_seats = copy.deepcopy(ref_seats)
+    stream = DetectionStream(n_seats, seed, config)
+    dt = timedelta(seconds=config["tick_seconds"])
+    now = SIM_START
+
+    for t in range(1, ticks + 1):
+        now += dt
+        detections, reserve = stream.step()
+        apply_reservations(ref_seats, seat_ids, reserve, now)
+        apply_reservations(cand_seats, seat_ids, reserve, now)
+
+        ref_results, ref_alerts = run_tick(reference, ref_seats, seat_ids, detections, now)
+        cand_results, cand_alerts = run_tick(candidate, cand_seats, seat_ids, detections, now)
+
+        for sid, a, b in zip(seat_ids, ref_results, cand_results):
+            if a != b:
+                return f"tick {t} {sid}: update_seat_state {a!r} != {b!r}"
+        if ref_alerts != cand_alerts:
+            return f"tick {t}: alerts 다름 ({len(ref_alerts)} vs {len(cand_alerts)})"
+        for sid in seat_ids:
+            if ref_seats[sid] != cand_seats[sid]:
+                keys = [k for k in ref_seats[sid] if ref_seats[sid][k] != cand_seats[sid].get(k)]
+                return f"tick {t} {sid}: 좌석 상태 다름 {keys}"
+
+    return None
+
+
+# ============================================
+# 실행
+# ============================================
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--engine", default="logic.seat_logic",
+                        help="벤치마크할 엔진 모듈 (seat_logic과 같은 함수 제공)")
+    parser.add_argument("--seats", type=int, default=10000)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--memory-ticks", type=int, default=20)
+    parser.add_argument("--soak-ticks", type=int, default=0,
+                        help="0보다 크면 장시간 실행 메모리 추이 측정")
+    parser.add_argument("--equiv-seats", type=int, default=500)
+    parser.add_argument("--equiv-ticks", type=int, default=3000,
+                        help="기준 엔진과 비교할 tick 수 (기본 10분)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = importlib.import_module(args.engine)
+    cfg = BENCH_CONFIG
+    sim_min = args.ticks * cfg["tick_seconds"] / 60
+    print(f"=== {args.engine}: 좌석 {args.seats}개, {args.ticks} tick ({sim_min:.1f}분) ===")
+
+    if engine is not reference:
+        mismatch = check_equivalence(engine, args.equiv_seats, args.equiv_ticks, args.seed, cfg)
+        if mismatch:
+            print(f"[동일성] 실패 → {mismatch}")
+            return
+        print(f"[동일성] 통과 (좌석 {args.equiv_seats}개, {args.equiv_ticks} tick)")
+
+    r = bench_throughput(engine, args.seats, args.ticks, args.seed, cfg)
+    print(f"[처리량] {r['ticks_per_sec']:.2f} ticks/s, "
+          f"{r['seat_updates_per_sec']:.0f} seat-updates/s, {r['ms_per_tick']:.1f} ms/tick")
+    print(f"         alerts {r['alerts']}, 최종 상태 {r['final_states']}")
+
+    m = bench_memory(engine, args.seats, args.memory_ticks, args.seed, cfg)
+    print(f"[메모리] 좌석당 {m['bytes_per_seat']:.0f} B, "
+          f"tick당 peak {m['peak_bytes_per_tick'] / 1024:.1f} KiB "
+          f"(평균 {m['mean_peak_bytes_per_tick'] / 1024:.1f} KiB)")
+    print(f"[할당]   {args.memory_ticks} tick 동안 남은 블록 {m['retained_blocks']:+d}")
+    for where, count, size in m["top_allocations"]:
+        print(f"         {where}: {count:+d} blocks, {size:+d} B")
+
+    if args.soak_ticks > 0:
+        memory = bench_soak(engine, args.seats, args.soak_ticks, args.seed, cfg)
+        (t0, m0), (t1, m1) = memory[0], memory[-1]
+        growth = (m1 - m0) / max(t1 - t0, 1) * 1000
+        print(f"[soak]   {args.soak_ticks} tick, 1000 tick당 {growth / 1024:+.1f} KiB")
+        for t, mem in memory:
+            print(f"         tick {t}: {mem / 1024 / 1024:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,10 +19,15 @@ POLICY_CONFIG = {
 # -----------------------------
 # 좌석 초기화
 # -----------------------------
-def init_seats():
+def init_seats(seat_ids=None, now=None):
+    if seat_ids is None:
+        seat_ids = INITIAL_SEATS
+    if now is None:
+        now = datetime.now()
+
     seats = {}
 
-    for seat in INITIAL_SEATS:
+    for seat in seat_ids:
         is_reserved = random.choice([True, False])
 
         seats[seat] = {
@@ -31,11 +36,11 @@ def init_seats():
 
             # 예약 관련
             "reserved": is_reserved,
-            "reserved_at": datetime.now() if is_reserved else None,
+            "reserved_at": now if is_reserved else None,
 
             # DEADLINE
             "unreserve_deadline": (
-                datetime.now() + timedelta(minutes=1) 
+                now + timedelta(minutes=1) 
                 if is_reserved else None
             ),
             "release_remain": None,       # 남은 시간 (초)
@@ -96,7 +101,7 @@ def check_status(detections):
 # -----------------------------
 # DEADLINE 기반 임시 상태 + 연장 기능
 # -----------------------------
-def update_seat_state(seat, inferred_state):
+def update_seat_state(seat, inferred_state, now=None):
     if not seat["reserved"]:
         seat["state"] = "Empty"
         seat["temp_state"] = None
@@ -104,7 +109,8 @@ def update_seat_state(seat, inferred_state):
         seat["unreserve_deadline"] = None
         return "Empty"
 
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
     current = seat["state"]
     temp = seat.get("temp_state")
     temp_started = seat.get("temp_started")
@@ -260,8 +266,9 @@ def update_policies(seats, now=None):
 
     return alerts
 
-def update_release_timer(seats):
-    now = datetime.now()
+def update_release_timer(seats, now=None):
+    if now is None:
+        now = datetime.now()
 
     for sid, s in seats.items():
 
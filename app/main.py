@@ -5,20 +5,18 @@ from datetime import datetime
 import cv2
 import pandas as pd
 import time
-import json
 import numpy as np
 from ultralytics import YOLO
+from capture import CameraStream
+from detector import DETECTION_CONFIG, resolve_class_ids, detect
+from seat_layout import ROI_FILE, load_layout
 from logic.seat_logic import (
+    INITIAL_SEATS,
     init_seats,
     check_status,
     update_seat_state,
     update_policies,
 )
-def polygon_to_rect(points):
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    return min(xs), min(ys), max(xs), max(ys)
-
 def is_inside_polygon(bbox, polygon):
     x1, y1, x2, y2 = bbox
     test_points = [
@@ -40,9 +38,8 @@ def is_inside_polygon(bbox, polygon):
 def bbox_intersects_roi(bbox, roi):
     (x1, y1, x2, y2) = bbox   # YOLO bbox
 
-    # POLYGON → RECT로 변환
-    points = roi["points"]
-    rx1, ry1, rx2, ry2 = polygon_to_rect(points)
+    # POLYGON → RECT (seat_layout에서 미리 계산된 값)
+    rx1, ry1, rx2, ry2 = roi["rect"]
 
     # 교집합 영역 계산
     inter_x1 = max(x1, rx1)
@@ -63,13 +60,13 @@ st.set_page_config(page_title="열람실 좌석 모니터링", layout="wide")
 # YOLO 모델 로드
 model = YOLO("yolov8m.pt")
 
-# ROI 불러오기
-with open("seats_roi.json", "r") as f:
-    seat_rois = json.load(f)
+# ROI 불러오기 (좌석 id → polygon + rect 캐시)
+seat_rois = load_layout(ROI_FILE, seat_ids=INITIAL_SEATS)
 
-# 세션 초기화
+# 세션 초기화 (ROI가 없는 기본 좌석도 계속 관리, ROI 파일에만 있는 좌석은 추가)
 if "seats" not in st.session_state:
-    st.session_state["seats"] = init_seats()
+    seat_ids = INITIAL_SEATS + [sid for sid in seat_rois if sid not in INITIAL_SEATS]
+    st.session_state["seats"] = init_seats(seat_ids)
 if "ai_running" not in st.session_state:
     st.session_state["ai_running"] = False
 if "admin_mode" not in st.session_state:
@@ -126,47 +123,38 @@ if stop_btn:
 # 🎥 AI 판별 루프
 # ============================================
 if st.session_state["ai_running"]:
-    cap = cv2.VideoCapture(0)
-    keep_classes = ["person", "backpack", "laptop", "book", "clothes"]
+    # 실행 중 연결이 끊기면 grab에서 백오프 재연결을 시도함
+    stream = CameraStream(0)
+    if not stream.open():
+        st.error("웹캠을 불러올 수 없습니다.")
+        st.session_state["ai_running"] = False
 
-    def remap_class(name):
-        return name if name in keep_classes else "object"
+    # keep_classes 외의 클래스는 모델 안에서 바로 걸러짐
+    class_ids = resolve_class_ids(model.names, DETECTION_CONFIG["keep_classes"])
 
     while st.session_state["ai_running"]:
-        ret, frame = cap.read()
+        # sleep 동안 쌓인 프레임은 디코딩 없이 버리고 최신 프레임만 디코딩
+        ret, frame = stream.read_latest()
         if not ret:
             st.error("웹캠을 불러올 수 없습니다.")
             break
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = model(rgb)[0]
-
-        detections = []
-        for box in results.boxes:
-            cls = int(box.cls[0])
-            name = remap_class(results.names[cls])
+        detections = detect(model, frame, class_ids)
 
-            # object 모두 무시
-            if name == "object":
-                continue
-
-            x1, y1, x2, y2 = map(int, box.xyxy[0])
+        for d in detections:
+            x1, y1, x2, y2 = d["bbox"]
 
             # 시각화
             cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 255), 2)
-            cv2.putText(frame, name, (x1, y1 - 10),
+            cv2.putText(frame, d["name"], (x1, y1 - 10),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
 
-            detections.append({"name": name, "bbox": [x1, y1, x2, y2]})
-
         # ===========================
         # ROI 기반 좌석 판별
         # ===========================
-        SEAT_IDS = list(seats.keys())
         seat_states = {}
         
-        for idx, roi in enumerate(seat_rois):
-            seat_id = SEAT_IDS[idx]
+        for seat_id, roi in seat_rois.items():
             polygon = roi["points"]   # ⭐ 다각형 사용
             seat_info = seats[seat_id]
         
@@ -239,5 +227,5 @@ if st.session_state["ai_running"]:
 
         time.sleep(0.2)
 
-    cap.release()
+    stream.release()
     st.success("AI 좌석 판별 종료됨.")
\ No newline at end of file
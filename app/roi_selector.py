@@ -1,76 +1,292 @@
+# 수동 모드: python roi_selector.py
+# 자동 제안 모드: python roi_selector.py --auto data_processing/dataset_raw/nothing1 --resize
+import argparse
+import glob
+import os
 import cv2
-import json
 import numpy as np
+from capture import CAPTURE_CONFIG, CameraStream
+from seat_layout import ROI_FILE, assign_seat_ids, polygon_to_rect, save_layout
 
-# 저장될 ROI 파일 이름
-ROI_FILE = "seats_roi.json"
+# 자동 제안 설정
+AUTO_CONFIG = {
+    "max_frames": 30,                 # 빈 열람실 기준 프레임 최대 개수
+    "classes": ["chair", "dining table", "bench", "couch"],
+    "conf": 0.3,
+    "min_presence": 0.5,              # 이 비율 이상 프레임에서 잡힌 물체만 제안
+    "iou_match": 0.5,                 # 프레임 간 같은 물체로 볼 IoU
+    "snap_px": 12,                    # 직선 스냅 허용 거리 (px)
+    "min_quad_ratio": 0.5,            # 윤곽 사각형이 박스 면적의 이 비율 이상일 때 사용
+}
+
+WINDOW = "ROI Selector"
+VERTEX_PICK_PX = 10
 
 # ROI 저장 리스트
 rois = []
 points = []   # 현재 ROI의 4개 점 저장
+proposals = []  # 자동 제안 (수락 전)
+drag = None   # 드래그 중인 제안 꼭짓점 index
 frame = None
 
 
+# ============================================
+# 화면 그리기 / 마우스 이벤트
+# ============================================
+def draw(base):
+    view = base.copy()
+
+    for p in proposals:
+        pts = np.array(p["points"], np.int32).reshape((-1, 1, 2))
+        cv2.polylines(view, [pts], True, (0, 255, 255), 1)
+    if proposals:
+        cur = proposals[0]
+        pts = np.array(cur["points"], np.int32).reshape((-1, 1, 2))
+        cv2.polylines(view, [pts], True, (0, 165, 255), 2)
+        for (x, y) in cur["points"]:
+            cv2.circle(view, (x, y), 5, (0, 165, 255), -1)
+        cv2.putText(view, f"{cur['source']} ({len(proposals)} left)",
+                    tuple(cur["points"][0]), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 165, 255), 1)
+
+    for roi in rois:
+        pts = np.array(roi, np.int32).reshape((-1, 1, 2))
+        cv2.polylines(view, [pts], True, (0, 255, 0), 2)
+
+    for i, (x, y) in enumerate(points):
+        cv2.circle(view, (x, y), 4, (0, 255, 0), -1)
+        if i > 0:
+            cv2.line(view, tuple(points[i - 1]), (x, y), (0, 255, 0), 2)
+
+    cv2.imshow(WINDOW, view)
+
+
 def click_event(event, x, y, flags, param):
-    global points, frame
+    global drag
 
     if event == cv2.EVENT_LBUTTONDOWN:
+        # 현재 제안의 꼭짓점 근처 → 드래그로 조정
+        if proposals:
+            for vi, (px, py) in enumerate(proposals[0]["points"]):
+                if abs(px - x) <= VERTEX_PICK_PX and abs(py - y) <= VERTEX_PICK_PX:
+                    drag = vi
+                    return
+
         # 클릭한 점 추가
         points.append([x, y])
         print(f"Point added: {points[-1]}")
 
-        # 점 그리기
-        cv2.circle(frame, (x, y), 4, (0, 255, 0), -1)
-
-        # 선 그리기 (점이 2개 이상일 때)
-        if len(points) > 1:
-            cv2.line(frame, tuple(points[-2]), tuple(points[-1]), (0, 255, 0), 2)
-
         # 4번째 점 → ROI 완성
         if len(points) == 4:
-            # 마지막 점과 첫 점 연결하여 폐합
-            cv2.line(frame, tuple(points[3]), tuple(points[0]), (0, 255, 0), 2)
-
-            # ROI 저장
-            rois.append({
-                "points": points.copy()
-            })
+            rois.append(points.copy())
             print("ROI Completed:", rois[-1])
 
             # 다음 ROI 선택 준비
             points.clear()
 
-        cv2.imshow("ROI Selector", frame)
+    elif event == cv2.EVENT_MOUSEMOVE and drag is not None:
+        proposals[0]["points"][drag] = [x, y]
+
+    elif event == cv2.EVENT_LBUTTONUP:
+        drag = None
+
+    draw(frame)
+
+
+# ============================================
+# 자동 제안: 기준 프레임 → 좌석/책상 polygon
+# ============================================
+def load_reference_frames(frames_dir, max_frames):
+    paths = sorted(glob.glob(os.path.join(frames_dir, "*.jpg")))
+    if not paths:
+        return []
+
+    # 영상 전체에서 고르게 샘플링
+    step = max(len(paths) // max_frames, 1)
+    frames = [cv2.imread(p) for p in paths[::step][:max_frames]]
+    return [f for f in frames if f is not None]
+
+
+def resize_frames(frames, size):
+    return [cv2.resize(f, size, interpolation=cv2.INTER_AREA) for f in frames]
+
+
+def box_iou(a, b):
+    ix1, iy1 = max(a[0], b[0]), max(a[1], b[1])
+    ix2, iy2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(ix2 - ix1, 0) * max(iy2 - iy1, 0)
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def cluster_detections(per_frame, iou_match):
+    # 프레임마다 잡힌 박스를 IoU로 묶어서 같은 가구끼리 평균
+    clusters = []
+    for dets in per_frame:
+        for d in dets:
+            for c in clusters:
+                if c["name"] == d["name"] and box_iou(c["mean"], d["bbox"]) >= iou_match:
+                    c["boxes"].append(d["bbox"])
+                    c["mean"] = np.mean(c["boxes"], axis=0).tolist()
+                    break
+            else:
+                clusters.append({"name": d["name"], "boxes": [d["bbox"]], "mean": list(d["bbox"])})
+    return clusters
+
+
+def detect_lines(gray):
+    edges = cv2.Canny(gray, 50, 150)
+    lines = cv2.HoughLinesP(edges, 1, np.pi / 180, threshold=60,
+                            minLineLength=40, maxLineGap=8)
+    horizontal, vertical = [], []
+    if lines is not None:
+        for x1, y1, x2, y2 in lines[:, 0]:
+            if abs(y2 - y1) <= abs(x2 - x1) * 0.2:
+                horizontal.append((y1 + y2) / 2)
+            elif abs(x2 - x1) <= abs(y2 - y1) * 0.2:
+                vertical.append((x1 + x2) / 2)
+    return edges, horizontal, vertical
+
+
+def snap(value, candidates, tol):
+    near = [c for c in candidates if abs(c - value) <= tol]
+    return min(near, key=lambda c: abs(c - value)) if near else value
+
+
+def refine_box(box, edges, horizontal, vertical, cfg):
+    x1, y1, x2, y2 = [int(v) for v in box]
+    h, w = edges.shape
+
+    # 1) 박스 안 윤곽선이 사각형이면 그대로 사용 (원근 왜곡 반영)
+    pad = cfg["snap_px"]
+    cx1, cy1 = max(x1 - pad, 0), max(y1 - pad, 0)
+    cx2, cy2 = min(x2 + pad, w), min(y2 + pad, h)
+    crop = cv2.dilate(edges[cy1:cy2, cx1:cx2], np.ones((3, 3), np.uint8))
+    contours, _ = cv2.findContours(crop, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if contours:
+        largest = max(contours, key=cv2.contourArea)
+        approx = cv2.approxPolyDP(largest, 0.04 * cv2.arcLength(largest, True), True)
+        box_area = max((x2 - x1) * (y2 - y1), 1)
+        if len(approx) == 4 and cv2.contourArea(approx) >= cfg["min_quad_ratio"] * box_area:
+            return [[int(px) + cx1, int(py) + cy1] for px, py in approx[:, 0]]
+
+    # 2) 아니면 박스 변을 가까운 직선(책상 모서리 등)에 스냅
+    tol = cfg["snap_px"]
+    x1, x2 = snap(x1, vertical, tol), snap(x2, vertical, tol)
+    y1, y2 = snap(y1, horizontal, tol), snap(y2, horizontal, tol)
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    return [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+
+
+def propose_rois(frames, cfg):
+    from ultralytics import YOLO
+    from detector import detect
+
+    model = YOLO("yolov8m.pt")
+    det_cfg = {"keep_classes": cfg["classes"], "conf": cfg["conf"]}
+    per_frame = [detect(model, f, config=det_cfg) for f in frames]
+
+    # 지나가는 사람/물건을 지운 배경 (중앙값)
+    background = np.median(np.stack(frames), axis=0).astype(np.uint8)
+    gray = cv2.cvtColor(background, cv2.COLOR_BGR2GRAY)
+    edges, horizontal, vertical = detect_lines(gray)
+
+    found = []
+    for c in cluster_detections(per_frame, cfg["iou_match"]):
+        if len(c["boxes"]) < cfg["min_presence"] * len(frames):
+            continue
+        found.append({
+            "source": c["name"],
+            "points": refine_box(c["mean"], edges, horizontal, vertical, cfg),
+        })
+
+    # 위 → 아래, 왼쪽 → 오른쪽 순서로 검토
+    found.sort(key=lambda p: (polygon_to_rect(p["points"])[1], polygon_to_rect(p["points"])[0]))
+    return background, found
+
+
+# ============================================
+# 실행
+# ============================================
+def grab_live_frame():
+    # main.py와 같은 해상도로 열어야 ROI 좌표가 그대로 맞음
+    stream = CameraStream(0)
+    ret, live = stream.read() if stream.open() else (False, None)
+    stream.release()
+    return live if ret else None
+
+
+def main():
+    global frame
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--auto", metavar="FRAMES_DIR",
+                        help="extract_frames.py로 뽑은 빈 열람실 프레임 폴더")
+    parser.add_argument("--resize", action="store_true",
+                        help="기준 프레임 해상도가 카메라 설정과 다르면 카메라 해상도로 맞춤")
+    parser.add_argument("--output", default=ROI_FILE)
+    args = parser.parse_args()
+
+    if args.auto:
+        frames = load_reference_frames(args.auto, AUTO_CONFIG["max_frames"])
+        if not frames:
+            print(f" '{args.auto}' 폴더에서 프레임을 찾지 못했습니다.")
+            return
+        # ROI는 main.py 카메라 해상도 기준 좌표여야 함
+        size = (CAPTURE_CONFIG["width"], CAPTURE_CONFIG["height"])
+        h, w = frames[0].shape[:2]
+        if (w, h) != size:
+            if not args.resize:
+                print(f" 오류: 프레임 해상도 {w}x{h} 가 카메라 설정 {size[0]}x{size[1]} 와 다릅니다. "
+                      f"--resize 로 카메라 해상도에 맞추거나 같은 해상도로 다시 추출하세요.")
+                return
+            if abs(w / h - size[0] / size[1]) > 0.01:
+                print(f" 주의: 화면 비율이 다릅니다 ({w}x{h} → {size[0]}x{size[1]}). "
+                      f"카메라 화각과 맞는지 확인하세요.")
+            frames = resize_frames(frames, size)
+        print(f"기준 프레임 {len(frames)}장으로 좌석 후보를 찾는 중...")
+        frame, found = propose_rois(frames, AUTO_CONFIG)
+        proposals.extend(found)
+        print(f"좌석 후보 {len(proposals)}개 제안됨")
+    else:
+        frame = grab_live_frame()
+        if frame is None:
+            print(" 웹캠에서 프레임을 불러오지 못했습니다.")
+            return
+
+    cv2.namedWindow(WINDOW)
+    cv2.setMouseCallback(WINDOW, click_event)
 
+    print("===  ROI 다각형 선택기 실행 중 ===")
+    print("좌석 영역을 마우스로 4번 클릭해 주세요 (4점 = 1개 좌석).")
+    if proposals:
+        print("주황색 후보: 꼭짓점 드래그로 조정 / A 키 → 수락 / D 키 → 버림")
+    print("S 키 → 저장 / ESC → 종료")
 
-# --- 1) 웹캠에서 한 프레임 가져오기 ---
-cap = cv2.VideoCapture(0)
-ret, frame = cap.read()
-cap.release()
+    draw(frame)
+    while True:
+        key = cv2.waitKey(20) & 0xFF
 
-if not ret:
-    print(" 웹캠에서 프레임을 불러오지 못했습니다.")
-    exit()
+        if key == ord('a') and proposals:
+            rois.append(proposals.pop(0)["points"])
+            print("ROI Accepted:", rois[-1])
+            draw(frame)
 
-cv2.namedWindow("ROI Selector")
-cv2.setMouseCallback("ROI Selector", click_event)
+        elif key == ord('d') and proposals:
+            proposals.pop(0)
+            draw(frame)
 
-print("===  ROI 다각형 선택기 실행 중 ===")
-print("좌석 영역을 마우스로 4번 클릭해 주세요 (4점 = 1개 좌석).")
-print("S 키 → 저장 / ESC → 종료")
+        elif key == ord('s'):
+            layout = assign_seat_ids(rois)
+            save_layout(layout, args.output)
+            print(f" ROI 저장 완료 → {args.output} (좌석 {', '.join(layout)})")
+            break
 
-while True:
-    cv2.imshow("ROI Selector", frame)
-    key = cv2.waitKey(1)
+        elif key == 27:  # ESC
+            print(" ROI 선택 취소")
+            break
 
-    if key == ord('s'):
-        with open(ROI_FILE, "w") as f:
-            json.dump(rois, f, indent=4)
-        print(f" ROI 저장 완료 → {ROI_FILE}")
-        break
+    cv2.destroyAllWindows()
 
-    elif key == 27:  # ESC
-        print(" ROI 선택 취소")
-        break
 
-cv2.destroyAllWindows()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import json
+import os
+
+# -----------------------------
+# 설정값
+# -----------------------------
+ROI_FILE = "seats_roi.json"
+ROW_LABELS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def geometry_path(layout_path):
+    root, _ = os.path.splitext(layout_path)
+    return root + "_geometry.json"
+
+
+# -----------------------------
+# 좌석 id 자동 부여 (행: A, B, ... / 열: 1, 2, ...)
+# -----------------------------
+def assign_seat_ids(polygons):
+    if not polygons:
+        return {}
+
+    rects = [polygon_to_rect(p) for p in polygons]
+    centers = [((r[0] + r[2]) / 2, (r[1] + r[3]) / 2) for r in rects]
+    heights = sorted(r[3] - r[1] for r in rects)
+    row_gap = heights[len(heights) // 2] / 2  # 중앙값 높이의 절반 이상 떨어지면 다른 행
+
+    order = sorted(range(len(polygons)), key=lambda i: centers[i][1])
+    rows = [[order[0]]]
+    for i in order[1:]:
+        row_y = sum(centers[j][1] for j in rows[-1]) / len(rows[-1])
+        if centers[i][1] - row_y > row_gap:
+            rows.append([i])
+        else:
+            rows[-1].append(i)
+
+    layout = {}
+    for r, row in enumerate(rows):
+        label = ROW_LABELS[r] if r < len(ROW_LABELS) else f"R{r + 1}-"
+        for c, i in enumerate(sorted(row, key=lambda j: centers[j][0])):
+            layout[f"{label}{c + 1}"] = {"points": polygons[i]}
+
+    return layout
+
+
+# -----------------------------
+# 기하 정보 캐시 (매 프레임 다시 계산하지 않도록)
+# -----------------------------
+def polygon_to_rect(points):
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def polygon_area(points):
+    # 신발끈 공식
+    n = len(points)
+    s = 0
+    for i in range(n):
+        x1, y1 = points[i]
+        x2, y2 = points[(i + 1) % n]
+        s += x1 * y2 - x2 * y1
+    return abs(s) / 2
+
+
+def build_geometry(layout):
+    geometry = {}
+    for sid, roi in layout.items():
+        pts = roi["points"]
+        rx1, ry1, rx2, ry2 = polygon_to_rect(pts)
+        geometry[sid] = {
+            "points": pts,
+            "rect": [rx1, ry1, rx2, ry2],
+            "center": [(rx1 + rx2) / 2, (ry1 + ry2) / 2],
+            "area": polygon_area(pts),
+        }
+    return geometry
+
+
+# -----------------------------
+# 저장 / 불러오기
+# -----------------------------
+def save_layout(layout, path=ROI_FILE):
+    with open(path, "w") as f:
+        json.dump(layout, f, indent=4)
+
+    with open(geometry_path(path), "w") as f:
+        json.dump(build_geometry(layout), f, indent=4)
+
+
+def _entry_points(roi):
+    if "points" in roi:
+        return roi["points"]
+    # 예전 사각형 형식 {"x1", "y1", "x2", "y2"}
+    x1, y1, x2, y2 = roi["x1"], roi["y1"], roi["x2"], roi["y2"]
+    return [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+
+
+def load_layout(path=ROI_FILE, seat_ids=None):
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    # 예전 list 형식은 순서대로 seat_ids 에 매칭
+    # seat_ids가 모자라면 나머지는 아직 쓰이지 않은 S{n} (n = 순번부터 하나씩 증가)
+    if isinstance(data, list):
+        ids = list(seat_ids or [])[:len(data)]
+        n = len(ids) + 1
+        while len(ids) < len(data):
+            if f"S{n}" not in ids:
+                ids.append(f"S{n}")
+            n += 1
+        data = {sid: roi for sid, roi in zip(ids, data)}
+
+    layout = {sid: {"points": _entry_points(roi)} for sid, roi in data.items()}
+
+    # 캐시가 현재 좌표와 같을 때만 사용, 아니면 새로 계산
+    cache_file = geometry_path(path)
+    if os.path.exists(cache_file):
+        with open(cache_file, "r") as f:
+            cached = json.load(f)
+        if all(sid in cached and cached[sid].get("points") == roi["points"]
+               and "rect" in cached[sid]
+               for sid, roi in layout.items()):
+            return {sid: cached[sid] for sid in layout}
+
+    return build_geometry(layout)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# app 폴더 기준 import (main.py와 동일: from seat_layout import ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,54 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from roi_selector import AUTO_CONFIG, cluster_detections, refine_box, resize_frames  # noqa: E402
+
+
+# -----------------------------
+# 프레임 간 검출 묶기
+# -----------------------------
+def test_cluster_detections_merges_same_object_across_frames():
+    per_frame = [
+        [{"name": "chair", "bbox": [0, 0, 10, 10]}, {"name": "chair", "bbox": [50, 50, 60, 60]}],
+        [{"name": "chair", "bbox": [1, 1, 11, 11]}],
+        [{"name": "dining table", "bbox": [0, 0, 10, 10]}],
+    ]
+
+    clusters = cluster_detections(per_frame, iou_match=0.5)
+
+    assert [(c["name"], len(c["boxes"])) for c in clusters] == [
+        ("chair", 2), ("chair", 1), ("dining table", 1),
+    ]
+    assert clusters[0]["mean"] == [0.5, 0.5, 10.5, 10.5]
+
+
+# -----------------------------
+# 윤곽 / 직선으로 박스 다듬기
+# -----------------------------
+def test_refine_box_snaps_to_nearby_lines_without_contour():
+    edges = np.zeros((100, 100), np.uint8)
+
+    points = refine_box([20, 20, 60, 60], edges, horizontal=[25.0, 90.0], vertical=[15.0],
+                        cfg=AUTO_CONFIG)
+
+    assert points == [[15, 25], [60, 25], [60, 60], [15, 60]]
+
+
+def test_refine_box_uses_quad_contour():
+    edges = np.zeros((100, 100), np.uint8)
+    quad = np.array([[22, 20], [62, 24], [58, 60], [20, 58]], np.int32)
+    cv2.polylines(edges, [quad], True, 255, 1)
+
+    points = refine_box([20, 20, 62, 60], edges, [], [], AUTO_CONFIG)
+
+    assert len(points) == 4
+    for x, y in points:
+        assert min(abs(x - qx) + abs(y - qy) for qx, qy in quad.tolist()) <= 4
+
+
+def test_resize_frames_to_capture_size():
+    frames = [np.zeros((1080, 1920, 3), np.uint8)]
+
+    assert resize_frames(frames, (640, 480))[0].shape == (480, 640, 3)
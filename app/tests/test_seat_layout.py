@@ -0,0 +1,109 @@
+import json
+
+from seat_layout import assign_seat_ids, build_geometry, geometry_path, load_layout, save_layout
+
+
+def square(x, y, size=10):
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size]]
+
+
+def write(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+# -----------------------------
+# 좌석 id 자동 부여
+# -----------------------------
+def test_assign_seat_ids_groups_rows_top_to_bottom_left_to_right():
+    # 같은 행 안에서 y가 조금씩 달라도 한 행으로 묶임
+    polygons = [square(200, 103), square(0, 100), square(100, 0), square(0, 2), square(100, 98)]
+
+    layout = assign_seat_ids(polygons)
+
+    assert {sid: roi["points"][0] for sid, roi in layout.items()} == {
+        "A1": [0, 2],
+        "A2": [100, 0],
+        "B1": [0, 100],
+        "B2": [100, 98],
+        "B3": [200, 103],
+    }
+
+
+def test_assign_seat_ids_empty():
+    assert assign_seat_ids([]) == {}
+
+
+# -----------------------------
+# 기하 정보
+# -----------------------------
+def test_build_geometry():
+    geometry = build_geometry({"A1": {"points": [[0, 0], [4, 0], [4, 2], [0, 2]]}})
+
+    assert geometry["A1"]["rect"] == [0, 0, 4, 2]
+    assert geometry["A1"]["center"] == [2, 1]
+    assert geometry["A1"]["area"] == 8
+
+
+# -----------------------------
+# 불러오기 (예전 형식 / 캐시)
+# -----------------------------
+def test_load_legacy_list_matches_seat_ids_in_order(tmp_path):
+    path = str(tmp_path / "rois.json")
+    write(path, [{"points": square(0, 0)}, {"points": square(50, 0)}])
+
+    layout = load_layout(path, seat_ids=["A1", "A2", "A3"])
+
+    assert list(layout) == ["A1", "A2"]
+    assert layout["A2"]["rect"] == [50, 0, 60, 10]
+
+
+def test_load_legacy_rect_format(tmp_path):
+    path = str(tmp_path / "rois.json")
+    write(path, [{"x1": 1, "y1": 2, "x2": 5, "y2": 8}])
+
+    layout = load_layout(path)
+
+    assert layout["S1"]["points"] == [[1, 2], [5, 2], [5, 8], [1, 8]]
+    assert layout["S1"]["rect"] == [1, 2, 5, 8]
+
+
+def test_load_legacy_list_longer_than_seat_ids_keeps_every_roi(tmp_path):
+    path = str(tmp_path / "rois.json")
+    write(path, [{"points": square(i * 20, 0)} for i in range(5)])
+
+    assert list(load_layout(path, seat_ids=["A1", "A2"])) == ["A1", "A2", "S3", "S4", "S5"]
+    # 이미 쓰인 id는 건너뜀
+    assert list(load_layout(path, seat_ids=["S4", "A2"])) == ["S4", "A2", "S3", "S5", "S6"]
+
+
+def test_save_and_load_id_keyed_layout_uses_cache(tmp_path):
+    path = str(tmp_path / "rois.json")
+    save_layout({"B1": {"points": square(0, 0)}}, path)
+
+    # 캐시 값이 그대로 쓰이는지 확인하기 위해 표시를 남김
+    with open(geometry_path(path)) as f:
+        cached = json.load(f)
+    cached["B1"]["area"] = -1
+    write(geometry_path(path), cached)
+
+    assert load_layout(path)["B1"]["area"] == -1
+
+
+def test_stale_cache_is_recomputed(tmp_path):
+    path = str(tmp_path / "rois.json")
+    save_layout({"B1": {"points": square(0, 0)}}, path)
+    write(path, {"B1": {"points": square(30, 30)}})
+
+    assert load_layout(path)["B1"]["rect"] == [30, 30, 40, 40]
+
+
+def test_partial_cache_is_recomputed(tmp_path):
+    path = str(tmp_path / "rois.json")
+    write(path, {"A1": {"points": square(0, 0)}, "A2": {"points": square(20, 0)}})
+    write(geometry_path(path), {"A1": {"points": square(0, 0), "rect": [9, 9, 9, 9]}})
+
+    layout = load_layout(path)
+
+    assert layout["A1"]["rect"] == [0, 0, 10, 10]
+    assert layout["A2"]["rect"] == [20, 0, 30, 10]